@@ -1,18 +1,36 @@
 """Email service module for Gmail API operations."""
 
+import asyncio
 import base64
+import binascii
+import contextlib
 from email.mime.text import MIMEText
 
-from googleapiclient.errors import HttpError
+from .gmail_auth import get_gmail_service, new_authorized_http
 
-from .gmail_auth import get_gmail_service
+# Maximum sub-requests allowed per Gmail batch HTTP call
+_BATCH_SIZE = 100
 
+# Cap on in-flight requests in the concurrent-fetch fallback, to stay
+# within Gmail's per-user rate limits
+_MAX_CONCURRENT_GETS = 10
 
-async def fetch_unread_emails(limit: int = 10) -> list[dict]:
+# Headers requested from the metadata format when bodies are skipped
+_METADATA_HEADERS = ["Subject", "From", "Date"]
+
+# Translation table mapping the URL-safe base64 alphabet to the standard one
+_B64_URLSAFE_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+
+
+async def fetch_unread_emails(limit: int = 10, include_body: bool = True) -> list[dict]:
     """Fetch unread emails from Gmail using Gmail API.
 
     Args:
         limit: Maximum number of emails to fetch
+        include_body: Whether to fetch full message bodies. When False, only
+            the headers we display are requested (format="metadata"), which
+            avoids transferring full MIME payloads, and the body falls back
+            to the snippet.
 
     Returns:
         List of email dictionaries with:
@@ -36,61 +54,226 @@ async def fetch_unread_emails(limit: int = 10) -> list[dict]:
 
     service = get_gmail_service()
 
-    # Query for unread messages in inbox
-    results = (
-        service.users()
-        .messages()
-        .list(userId="me", q="is:unread", maxResults=limit)
-        .execute()
+    # Only request full MIME payloads when bodies are actually needed;
+    # otherwise a metadata fetch with a header whitelist is enough. The
+    # fields parameter trims unused response fields (labelIds, sizeEstimate,
+    # historyId, ...) from the wire format either way.
+    if include_body:
+        get_params = {
+            "format": "full",
+            "fields": "id,threadId,snippet,payload",
+        }
+    else:
+        get_params = {
+            "format": "metadata",
+            "metadataHeaders": _METADATA_HEADERS,
+            "fields": "id,threadId,snippet,payload/headers",
+        }
+
+    emails: list[dict] = []
+
+    # Pipeline list and get: the listing of the next page runs while the
+    # current page's messages are being fetched and processed, so paging
+    # never adds a serial round trip. Gmail can return short pages, so a
+    # single list() is not guaranteed to cover the limit. List requests get
+    # a transport of their own -- the prefetch overlaps the batch get, and
+    # httplib2 connections are not thread-safe -- created per call so
+    # concurrent fetches never share it either.
+    list_http = new_authorized_http()
+    next_page = asyncio.create_task(
+        asyncio.to_thread(_list_unread_page, service, list_http, limit, None)
     )
 
-    messages = results.get("messages", [])
+    try:
+        while next_page is not None and len(emails) < limit:
+            results = await next_page
+            next_page = None
+
+            messages = results.get("messages", [])
+            if not messages:
+                break
+
+            message_ids = [msg["id"] for msg in messages][: limit - len(emails)]
+            page_token = results.get("nextPageToken")
+
+            # Prefetch the next page while this batch is fetched and parsed
+            remaining = limit - len(emails) - len(message_ids)
+            if page_token and remaining > 0:
+                next_page = asyncio.create_task(
+                    asyncio.to_thread(
+                        _list_unread_page, service, list_http, remaining, page_token
+                    )
+                )
+
+            try:
+                raw_messages = await asyncio.to_thread(
+                    _batch_get_messages, service, message_ids, get_params
+                )
+            except Exception:
+                # Batch endpoint unavailable, rejected the request, or the
+                # transport failed mid-call; fall back to issuing the
+                # individual gets concurrently off the event loop thread
+                raw_messages = await _gather_get_messages(
+                    service, message_ids, get_params
+                )
+
+            for message in raw_messages:
+                try:
+                    # Extract headers
+                    get_header = _header_lookup(
+                        message.get("payload", {}).get("headers", [])
+                    )
+                    subject = get_header("Subject")
+                    from_addr = get_header("From")
+                    date = get_header("Date")
+
+                    # Extract body (metadata fetches carry no payload body,
+                    # so this falls through to the snippet)
+                    body = (
+                        _get_message_body(message)
+                        if include_body
+                        else message.get("snippet", "")
+                    )
+
+                    email_info = {
+                        "id": message["id"],
+                        "thread_id": message["threadId"],
+                        "from": from_addr,
+                        "subject": subject,
+                        "date": date,
+                        "body": body,
+                    }
+
+                    emails.append(email_info)
+
+                except Exception:
+                    # Skip messages with unexpected errors
+                    # Continue processing remaining messages
+                    continue
+    finally:
+        # Reached with a live prefetch only when the batch fetch raised out
+        # of the loop; consume the orphaned task's outcome so a failed
+        # prefetch never warns about an unretrieved exception at garbage
+        # collection. A speculative prefetch failing must not mask the
+        # in-flight result, so any error it raised is swallowed.
+        if next_page is not None:
+            next_page.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await next_page
 
-    if not messages:
-        return []
-
-    emails = []
-
-    for msg in messages:
-        try:
-            # Fetch full message details
-            message = (
-                service.users()
-                .messages()
-                .get(userId="me", id=msg["id"], format="full")
-                .execute()
+    return emails
+
+
+def _list_unread_page(service, http, max_results: int, page_token: str | None) -> dict:
+    """List one page of unread message IDs.
+
+    Args:
+        service: Gmail API service object
+        http: Transport to issue the request on; must not be shared with
+            any other request in flight
+        max_results: Maximum number of message IDs to return
+        page_token: Token for the page to fetch, or None for the first page
+
+    Returns:
+        Gmail list response with message IDs and the next page token
+    """
+    list_params = {
+        "userId": "me",
+        "q": "is:unread",
+        "maxResults": max_results,
+        "fields": "messages/id,nextPageToken",
+    }
+    if page_token:
+        list_params["pageToken"] = page_token
+
+    return service.users().messages().list(**list_params).execute(http=http)
+
+
+def _batch_get_messages(
+    service, message_ids: list[str], get_params: dict
+) -> list[dict]:
+    """Fetch message details for multiple messages in batched HTTP calls.
+
+    Instead of one HTTPS round trip per message, messages are fetched through
+    the Gmail batch endpoint, which accepts up to 100 sub-requests per call.
+
+    Args:
+        service: Gmail API service object
+        message_ids: Message IDs to fetch
+        get_params: Extra parameters for each messages().get() request
+            (e.g., format and metadataHeaders)
+
+    Returns:
+        List of Gmail message objects, in the same order as message_ids.
+        Messages that fail to fetch (e.g., deleted, permission issues) are
+        omitted.
+    """
+    results: dict[str, dict] = {}
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            results[request_id] = response
+
+    # Gmail's batch endpoint caps at 100 sub-requests per call. Concurrent
+    # tool calls run these in separate worker threads, so the batch must not
+    # ride the service object's shared transport.
+    http = new_authorized_http()
+    for start in range(0, len(message_ids), _BATCH_SIZE):
+        batch = service.new_batch_http_request()
+        for msg_id in message_ids[start : start + _BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(userId="me", id=msg_id, **get_params),
+                callback=_collect,
+                request_id=msg_id,
             )
+        batch.execute(http=http)
 
-            # Extract headers
-            headers = message.get("payload", {}).get("headers", [])
-            subject = _get_header(headers, "Subject")
-            from_addr = _get_header(headers, "From")
-            date = _get_header(headers, "Date")
-
-            # Extract body
-            body = _get_message_body(message)
-
-            email_info = {
-                "id": message["id"],
-                "thread_id": message["threadId"],
-                "from": from_addr,
-                "subject": subject,
-                "date": date,
-                "body": body,
-            }
-
-            emails.append(email_info)
-
-        except HttpError:
-            # Skip messages that fail to fetch (e.g., deleted, permission issues)
-            # Continue processing remaining messages
-            continue
-        except Exception:
-            # Skip messages with unexpected errors
-            # Continue processing remaining messages
-            continue
+    return [results[msg_id] for msg_id in message_ids if msg_id in results]
 
-    return emails
+
+async def _gather_get_messages(
+    service, message_ids: list[str], get_params: dict
+) -> list[dict]:
+    """Fetch message details concurrently, one request per message.
+
+    Fallback for when the batch endpoint is unavailable. Each blocking
+    messages().get() call runs in a worker thread and all of them are awaited
+    together, overlapping the network round trips instead of serializing
+    them. A semaphore bounds concurrency to respect Gmail rate limits.
+
+    Args:
+        service: Gmail API service object
+        message_ids: Message IDs to fetch
+        get_params: Extra parameters for each messages().get() request
+            (e.g., format and metadataHeaders)
+
+    Returns:
+        List of Gmail message objects, in the same order as message_ids.
+        Messages that fail to fetch are omitted.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_GETS)
+
+    def _get_one(msg_id: str) -> dict:
+        # The service's own transport is a single httplib2 connection and is
+        # not thread-safe, so each concurrent request gets its own transport
+        return (
+            service.users()
+            .messages()
+            .get(userId="me", id=msg_id, **get_params)
+            .execute(http=new_authorized_http())
+        )
+
+    async def _get_bounded(msg_id: str) -> dict | None:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_get_one, msg_id)
+            except Exception:
+                # Skip messages that fail to fetch (API or transport errors),
+                # matching the per-message skip behavior of the serial loop
+                return None
+
+    raw_messages = await asyncio.gather(*(_get_bounded(m) for m in message_ids))
+    return [message for message in raw_messages if message is not None]
 
 
 async def create_draft_reply(thread_id: str, reply_body: str) -> dict:
@@ -121,8 +304,23 @@ async def create_draft_reply(thread_id: str, reply_body: str) -> dict:
 
     service = get_gmail_service()
 
-    # Get the original thread to extract necessary info for proper threading
-    thread = service.users().threads().get(userId="me", id=thread_id).execute()
+    # Get the original thread to extract necessary info for proper threading;
+    # only the message headers are used, so skip the bodies entirely. Run the
+    # blocking HTTP calls off the event loop thread, on their own transport
+    # so overlapping tool calls never share the service's connection.
+    http = new_authorized_http()
+    thread = await asyncio.to_thread(
+        service.users()
+        .threads()
+        .get(
+            userId="me",
+            id=thread_id,
+            format="metadata",
+            fields="messages/payload/headers",
+        )
+        .execute,
+        http=http,
+    )
 
     # Get the last message in the thread (the one we're replying to)
     messages = thread.get("messages", [])
@@ -130,21 +328,25 @@ async def create_draft_reply(thread_id: str, reply_body: str) -> dict:
         raise ValueError(f"No messages found in thread {thread_id}")
 
     original_message = messages[-1]
-    headers = original_message.get("payload", {}).get("headers", [])
+    get_header = _header_lookup(
+        original_message.get("payload", {}).get("headers", [])
+    )
 
     # Extract headers needed for proper threading
-    to_addr = _get_header(headers, "From")  # Reply to the sender
-    subject = _get_header(headers, "Subject")
-    message_id = _get_header(headers, "Message-ID")
-    references = _get_header(headers, "References") or ""
+    to_addr = get_header("From")  # Reply to the sender
+    subject = get_header("Subject")
+    message_id = get_header("Message-ID")
+    references = get_header("References")
 
     # Build References header for proper threading
-    # References should include all previous Message-IDs plus the one we're replying to
+    # References should include all previous Message-IDs plus the one we're
+    # replying to. split() already ignores surrounding whitespace, and
+    # dict.fromkeys dedupes in one ordered pass instead of a membership scan.
     if references:
-        references_list = references.strip().split()
-        if message_id and message_id not in references_list:
+        references_list = references.split()
+        if message_id:
             references_list.append(message_id)
-        new_references = " ".join(references_list)
+        new_references = " ".join(dict.fromkeys(references_list))
     else:
         new_references = message_id if message_id else ""
 
@@ -174,7 +376,10 @@ async def create_draft_reply(thread_id: str, reply_body: str) -> dict:
         }
     }
 
-    draft = service.users().drafts().create(userId="me", body=draft_body).execute()
+    draft = await asyncio.to_thread(
+        service.users().drafts().create(userId="me", body=draft_body).execute,
+        http=http,
+    )
 
     return {
         "draft_id": draft["id"],
@@ -183,20 +388,28 @@ async def create_draft_reply(thread_id: str, reply_body: str) -> dict:
     }
 
 
-def _get_header(headers: list[dict], name: str) -> str:
-    """Extract a specific header value from email headers.
+def _header_lookup(headers: list[dict]):
+    """Build a header lookup function specialized to one message.
+
+    The lowercased name -> value dict is built once and closed over, and the
+    bound dict.get is captured as a local, so each lookup is a direct call
+    with no per-lookup scans or attribute resolution.
 
     Args:
         headers: List of header dictionaries
-        name: Header name to find
 
     Returns:
-        Header value or empty string if not found
+        Function mapping a header name (case-insensitive) to its value,
+        or "" if the header is absent
     """
-    for header in headers:
-        if header.get("name", "").lower() == name.lower():
-            return header.get("value", "")
-    return ""
+    get = {
+        header.get("name", "").lower(): header.get("value", "") for header in headers
+    }.get
+
+    def lookup(name: str) -> str:
+        return get(name.lower(), "")
+
+    return lookup
 
 
 def _get_message_body(message: dict) -> str:
@@ -220,8 +433,32 @@ def _get_message_body(message: dict) -> str:
     return body
 
 
+def _iter_payload_parts(payload: dict):
+    """Yield every part of a MIME payload tree in document order.
+
+    Flattens the nested parts structure lazily with an explicit stack, so
+    consumers scan a single linear stream of parts and iteration stops as
+    soon as the consumer does.
+
+    Args:
+        payload: Message payload object
+
+    Yields:
+        Each payload part dict, depth-first in document order
+    """
+    stack = [payload]
+
+    while stack:
+        part = stack.pop()
+        yield part
+
+        # Push children in reverse so parts are visited in document order
+        if "parts" in part:
+            stack.extend(reversed(part["parts"]))
+
+
 def _extract_body_from_payload(payload: dict) -> str:
-    """Recursively extract text/plain body from message payload.
+    """Extract the first text/plain body from a message payload.
 
     Args:
         payload: Message payload object
@@ -229,27 +466,30 @@ def _extract_body_from_payload(payload: dict) -> str:
     Returns:
         Decoded plain text body
     """
-    # Check if this part has a body
-    if "body" in payload and "data" in payload["body"]:
-        mime_type = payload.get("mimeType", "")
-        if mime_type == "text/plain":
-            # Decode the base64-encoded body
-            body_data = payload["body"]["data"]
-            return base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")
-
-    # If multipart, recursively search parts
-    if "parts" in payload:
-        for part in payload["parts"]:
-            # Prefer text/plain over text/html
-            if part.get("mimeType") == "text/plain":
-                result = _extract_body_from_payload(part)
-                if result:
-                    return result
-
-        # If no text/plain found, try any part
-        for part in payload["parts"]:
-            result = _extract_body_from_payload(part)
-            if result:
-                return result
-
+    for part in _iter_payload_parts(payload):
+        if part.get("mimeType", "") == "text/plain" and "data" in part.get("body", {}):
+            body = _decode_body_data(part["body"]["data"])
+            if body:
+                return body
     return ""
+
+
+def _decode_body_data(data: str) -> str:
+    """Decode a URL-safe base64 body field into text.
+
+    Translates to the standard alphabet and feeds the C-level
+    binascii.a2b_base64 directly, skipping the validation and re-encoding
+    layers of base64.urlsafe_b64decode. Also tolerates the unpadded data
+    Gmail sometimes returns.
+
+    Args:
+        data: URL-safe base64-encoded body data
+
+    Returns:
+        Decoded text, with undecodable bytes ignored
+    """
+    raw = data.encode("ascii").translate(_B64_URLSAFE_TO_STANDARD)
+    padding = -len(raw) % 4
+    if padding:
+        raw += b"=" * padding
+    return binascii.a2b_base64(raw).decode("utf-8", errors="ignore")
@@ -1,12 +1,23 @@
 """Gmail API OAuth 2.0 authentication module."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+
+# orjson is optional; when available it replaces the stdlib json parser for
+# API responses (large full-format messages are parse-heavy)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Gmail API scopes
 # gmail.readonly - read emails
@@ -17,10 +28,86 @@ SCOPES = [
 ]
 
 
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses API responses with orjson.
+
+    orjson.loads takes bytes directly and decodes substantially faster than
+    the stdlib parser, which matters for full-format message payloads.
+    Serialization of request bodies is left to the base class; those are
+    small and rare here.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content if isinstance(content, str) else content.decode("utf-8")
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _response_model():
+    """Return the JSON model used for Gmail API responses."""
+    if orjson is not None:
+        return _OrjsonModel()
+    return JsonModel()
+
+
+# Cached service object and its credentials, reused across requests for the
+# process lifetime so each tool call skips token reads and discovery setup
+_cached_service = None
+_cached_creds = None
+
+
+def new_authorized_http():
+    """Return a fresh authorized HTTP transport for the current credentials.
+
+    The transport the service object was built with is a single httplib2
+    connection, which is not thread-safe: requests issued on it from more
+    than one thread at a time interleave bytes on the same socket. Any code
+    that executes requests concurrently must give each in-flight request its
+    own transport via execute(http=...), which this provides.
+
+    Returns:
+        An AuthorizedHttp wrapping a new httplib2.Http
+    """
+    if _cached_creds is None:
+        # Run the normal auth flow to populate the credentials
+        get_gmail_service()
+    return google_auth_httplib2.AuthorizedHttp(_cached_creds, http=httplib2.Http())
+
+
+@lru_cache(maxsize=1)
+def _resolve_auth_paths() -> tuple[Path, Path]:
+    """Resolve the credentials.json and token.json paths.
+
+    The environment and project layout don't change while the server runs,
+    so the lookup is computed once and cached.
+
+    Returns:
+        Tuple of (credentials_file, token_file) paths
+    """
+    # Get the project root directory (3 levels up from this file)
+    project_root = Path(__file__).parent.parent.parent
+
+    # Get paths from environment or use defaults relative to project root
+    credentials_path = os.getenv(
+        "GOOGLE_CREDENTIALS_PATH", str(project_root / "credentials.json")
+    )
+    token_path = os.getenv("GOOGLE_TOKEN_PATH", str(project_root / "token.json"))
+
+    return Path(credentials_path), Path(token_path)
+
+
 def get_gmail_service():
     """Authenticate and return Gmail API service.
 
-    This handles the OAuth 2.0 flow:
+    The service object is built once and cached for the process lifetime;
+    subsequent calls return it directly as long as the credentials are still
+    valid, avoiding repeated token file reads and API discovery.
+
+    On a cache miss this handles the OAuth 2.0 flow:
     1. Checks if token.json exists (saved credentials)
     2. If valid, uses it
     3. If expired, refreshes it
@@ -32,20 +119,15 @@ def get_gmail_service():
     Raises:
         FileNotFoundError: If credentials.json is missing
     """
-    creds = None
+    global _cached_service, _cached_creds
 
-    # Get the project root directory (3 levels up from this file)
-    project_root = Path(__file__).parent.parent.parent
+    # Reuse the cached service while its credentials remain valid
+    if _cached_service is not None and _cached_creds and _cached_creds.valid:
+        return _cached_service
 
-    # Get paths from environment or use defaults relative to project root
-    credentials_path = os.getenv(
-        "GOOGLE_CREDENTIALS_PATH", str(project_root / "credentials.json")
-    )
-    token_path = os.getenv("GOOGLE_TOKEN_PATH", str(project_root / "token.json"))
+    creds = None
 
-    # Convert to Path objects for better handling
-    credentials_file = Path(credentials_path)
-    token_file = Path(token_path)
+    credentials_file, token_file = _resolve_auth_paths()
 
     # Check if we have saved credentials (token.json)
     if token_file.exists():
@@ -80,8 +162,13 @@ def get_gmail_service():
         # Save credentials for next time
         token_file.write_text(creds.to_json())
 
-    # Build and return the Gmail API service
+    # Build the Gmail API service and cache it for subsequent calls
     try:
-        return build("gmail", "v1", credentials=creds)
+        _cached_service = build(
+            "gmail", "v1", credentials=creds, model=_response_model()
+        )
     except Exception as e:
         raise RuntimeError(f"Failed to build Gmail service: {e}")
+
+    _cached_creds = creds
+    return _cached_service
@@ -20,6 +20,11 @@ async def handle_list_tools() -> list[types.Tool]:
                         "description": "Maximum number of emails to fetch (default: 10)",
                         "default": 10,
                     },
+                    "include_body": {
+                        "type": "boolean",
+                        "description": "Whether to fetch full email bodies. Set to false for a faster fetch that returns only headers and a short snippet (default: true)",
+                        "default": True,
+                    },
                 },
                 "required": [],
             },
@@ -45,6 +50,33 @@ async def handle_list_tools() -> list[types.Tool]:
     ]
 
 
+def _format_email_summaries(emails: list[dict]):
+    """Yield one formatted summary block per email.
+
+    Generated lazily so the list of per-email blocks is never materialized
+    alongside the final joined string, keeping peak memory at roughly one
+    copy of the output for large bodies.
+
+    Args:
+        emails: Email dictionaries from fetch_unread_emails
+
+    Yields:
+        Formatted multi-line summary for each email
+    """
+    for email in emails:
+        yield "\n".join(
+            (
+                f"Thread ID: {email['thread_id']}",
+                f"Message ID: {email['id']}",
+                f"From: {email['from']}",
+                f"Subject: {email['subject']}",
+                f"Date: {email['date']}",
+                f"Body:\n{email['body']}",
+                "-" * 80,
+            )
+        )
+
+
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     """Handle MCP tool calls.
 
@@ -61,24 +93,15 @@ async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent
     try:
         if name == "get_unread_emails":
             limit = arguments.get("limit", 10)
-            emails = await email_service.fetch_unread_emails(limit)
+            include_body = arguments.get("include_body", True)
+            emails = await email_service.fetch_unread_emails(limit, include_body)
 
             if not emails:
                 return [types.TextContent(type="text", text="No unread emails found")]
 
-            # Format the email list for display
-            email_list = []
-            for email in emails:
-                email_summary = f"Thread ID: {email['thread_id']}\n"
-                email_summary += f"Message ID: {email['id']}\n"
-                email_summary += f"From: {email['from']}\n"
-                email_summary += f"Subject: {email['subject']}\n"
-                email_summary += f"Date: {email['date']}\n"
-                email_summary += f"Body:\n{email['body']}\n"
-                email_summary += "-" * 80
-                email_list.append(email_summary)
-
-            result = f"Found {len(emails)} unread email(s):\n\n" + "\n\n".join(email_list)
+            result = f"Found {len(emails)} unread email(s):\n\n" + "\n\n".join(
+                _format_email_summaries(emails)
+            )
             return [types.TextContent(type="text", text=result)]
 
         elif name == "create_draft_reply":